@@ -0,0 +1,48 @@
+import numpy as np
+import pytest
+
+bpy = pytest.importorskip("bpy")
+db = pytest.importorskip("databpy")
+newton = pytest.importorskip("newton")
+
+from warbler.geometryset import PointCloudAttributes
+
+N_POINTS = 4
+
+
+@pytest.fixture
+def pointcloud():
+    bob = db.BlenderObject.from_pointcloud(
+        np.arange(N_POINTS * 3, dtype=np.float32).reshape(N_POINTS, 3),
+        name="ParticleSource",
+    )
+    bob.store_named_attribute(np.zeros((N_POINTS, 3), dtype=np.float32), "velocity")
+    bob.store_named_attribute(np.full(N_POINTS, 2.0, dtype=np.float32), "mass")
+    bob.store_named_attribute(np.full(N_POINTS, 0.5, dtype=np.float32), "radius")
+    yield bob.object.data
+    bpy.data.objects.remove(bob.object)
+
+
+def test_to_props_shapes(pointcloud):
+    props = PointCloudAttributes(pointcloud).to_props()
+    assert props["position"].shape == (N_POINTS, 3)
+    assert props["velocity"].shape == (N_POINTS, 3)
+    assert props["mass"].shape == (N_POINTS,)
+    assert props["radius"].shape == (N_POINTS,)
+
+
+def test_builder_round_trip(pointcloud):
+    props = PointCloudAttributes(pointcloud).to_props()
+    builder = newton.ModelBuilder()
+    builder.add_particles(
+        pos=props["position"],
+        vel=props["velocity"],
+        mass=props["mass"],
+        radius=props["radius"],
+    )
+    model = builder.finalize(device="cpu")
+
+    assert model.particle_mass.shape == (N_POINTS,)
+    assert model.particle_radius.shape == (N_POINTS,)
+    np.testing.assert_allclose(model.particle_mass.numpy(), 2.0)
+    np.testing.assert_allclose(model.particle_radius.numpy(), 0.5)
@@ -1,7 +1,13 @@
 import bpy
-from bpy.utils import register_class, unregister_class
+from bpy.utils import register_classes_factory
 from bpy.props import PointerProperty
-from bpy.app.handlers import frame_change_post
+from bpy.app.handlers import (
+    depsgraph_update_post,
+    frame_change_post,
+    load_post,
+    redo_post,
+    undo_post,
+)
 
 from . import ops
 from . import panel
@@ -10,23 +16,42 @@ from . import manager
 
 CLASSES = ops.CLASSES + props.CLASSES + panel.CLASSES
 
+_register_classes, _unregister_classes = register_classes_factory(CLASSES)
+
+HANDLERS = (
+    (frame_change_post, manager._step_simulations),
+    (depsgraph_update_post, manager._tag_updates),
+    (load_post, manager._unbind),
+    (undo_post, manager._unbind),
+    (redo_post, manager._unbind),
+)
+
+
+def _append_handler(handlers: list, func) -> None:
+    # reloading the add-on creates a new function object, so match on the name as
+    # well to drop any stale copy that would otherwise also run every frame
+    key = (func.__module__, func.__qualname__)
+    for handler in list(handlers):
+        module = getattr(handler, "__module__", None)
+        if (module, getattr(handler, "__qualname__", None)) == key:
+            handlers.remove(handler)
+    handlers.append(func)
+
 
 def register():
-    for cls in CLASSES:
-        register_class(cls)
+    _register_classes()
     bpy.types.Scene.SimulationManager = manager.SimulationManager()  # type: ignore
     bpy.types.Object.wb = PointerProperty(type=props.WarblerObjectProperties)  # type: ignore
     bpy.types.Scene.wb = PointerProperty(type=props.WarblerSceneProperties)  # type: ignore
-    frame_change_post.append(manager._step_simulations)
+    for handlers, func in HANDLERS:
+        _append_handler(handlers, func)
 
 
 def unregister():
-    for cls in CLASSES:
-        unregister_class(cls)
+    _unregister_classes()
     del bpy.types.Scene.SimulationManager  # type: ignore
     # del bpy.types.Scene.wb_sim_list  # type: ignore
     del bpy.types.Object.wb  # type: ignore
-    try:
-        frame_change_post.remove(manager._step_simulations)
-    except ValueError:
-        pass
+    for handlers, func in HANDLERS:
+        if func in handlers:
+            handlers.remove(func)
@@ -4,32 +4,102 @@ import bpy
 import numpy as np
 
 
+# attributes read from a particle source, in the order they are laid out in the
+# shared float32 block, with the attribute type each is expected to be stored as
+PARTICLE_ATTRIBUTES: dict[str, db.AttributeTypes] = {
+    "position": db.AttributeTypes.FLOAT_VECTOR,
+    "velocity": db.AttributeTypes.FLOAT_VECTOR,
+    "mass": db.AttributeTypes.FLOAT,
+    "radius": db.AttributeTypes.FLOAT,
+}
+# float32 values per point for each attribute, and for the whole block
+_WIDTHS = [int(np.prod(a.value.dimensions)) for a in PARTICLE_ATTRIBUTES.values()]
+_STRIDE = sum(_WIDTHS)
+
+
 class PointCloudAttributes:
     def __init__(self, pointcloud: PointCloud):
         self.pointcloud = pointcloud
+        self._buffer: np.ndarray = np.empty(0, dtype=np.float32)
+        self._columns: dict[str, np.ndarray] = {}
 
     @property
     def attributes(self) -> bpy.types.AttributeGroupPointCloud:
         return self.pointcloud.attributes
 
+    @property
+    def point_count(self) -> int:
+        return len(self.pointcloud.points)
+
+    def _allocate(self, n_points: int) -> dict[str, np.ndarray]:
+        """Views into a single float32 block, one contiguous column per attribute.
+
+        The block is only reallocated when the number of points changes.
+        """
+        size = n_points * _STRIDE
+        if self._buffer.size == size and self._columns:
+            return self._columns
+
+        self._buffer = np.empty(size, dtype=np.float32)
+        self._columns = {}
+        start = 0
+        for name, width in zip(PARTICLE_ATTRIBUTES, _WIDTHS):
+            column = self._buffer[start : start + n_points * width]
+            # scalar attributes stay 1-D, as the builder expects one value per point
+            self._columns[name] = (
+                column.reshape((n_points, width)) if width > 1 else column
+            )
+            start += n_points * width
+        return self._columns
+
     def to_props(self) -> dict[str, np.ndarray]:
-        return {
-            name: db.Attribute(self.attributes[name]).as_array()
-            for name in ["position", "velocity", "mass", "radius"]
-            if name in self.attributes
-        }
+        attributes = self.attributes
+        if "position" not in attributes:
+            return {}
+
+        columns = self._allocate(self.point_count)
+        props = {}
+        for name, atype in PARTICLE_ATTRIBUTES.items():
+            attribute = attributes.get(name)
+            if attribute is None or attribute.data_type != atype.value.type_name:
+                continue
+            attribute.data.foreach_get(
+                atype.value.value_name, columns[name].reshape(-1)
+            )
+            props[name] = columns[name]
+        return props
 
 
 class GeometrySet:
-    def __init__(self, obj: Object, context: None | Context = None):
+    def __init__(
+        self,
+        obj: Object,
+        context: None | Context = None,
+        depsgraph: Depsgraph | None = None,
+    ):
         self.obj = obj
         self.context = context if isinstance(context, Context) else bpy.context
-        depsgraph: Depsgraph = self.context.view_layer.depsgraph
+        if depsgraph is None:
+            depsgraph = self.context.view_layer.depsgraph
         if depsgraph is None:
             raise ValueError
 
         self.eval_obj = depsgraph.id_eval_get(self.obj)
         self.geom = self.eval_obj.evaluated_geometry()  # type: ignore
+        self._pointcloud: PointCloudAttributes | None = None
+
+    @classmethod
+    def from_cache(
+        cls,
+        obj: Object,
+        cache: dict[str, "GeometrySet"],
+        depsgraph: Depsgraph | None = None,
+    ) -> "GeometrySet":
+        """Reuse the evaluated geometry of `obj` until its cache entry is dropped."""
+        geo = cache.get(obj.name_full)
+        if geo is None:
+            geo = cache[obj.name_full] = cls(obj, depsgraph=depsgraph)
+        return geo
 
     @property
     def instances(self):
@@ -37,9 +107,11 @@ class GeometrySet:
 
     @property
     def pointcloud(self) -> PointCloudAttributes:
-        return PointCloudAttributes(self.geom.pointcloud)
+        if self._pointcloud is None:
+            self._pointcloud = PointCloudAttributes(self.geom.pointcloud)
+        return self._pointcloud
 
     def _get_point_count(self, attributes) -> int:
         if "position" in attributes:
-            return len(db.Attribute(attributes["position"]))
+            return len(attributes["position"].data)
         return 0
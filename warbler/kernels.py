@@ -0,0 +1,45 @@
+import warp as wp
+
+
+@wp.kernel
+def restore_bodies(
+    indices: wp.array(dtype=wp.int32),  # type: ignore
+    body_q_in: wp.array(dtype=wp.transform),  # type: ignore
+    body_q_out: wp.array(dtype=wp.transform),  # type: ignore
+    body_qd_out: wp.array(dtype=wp.spatial_vector),  # type: ignore
+):
+    """Copy the pre-solve transform of each indexed body and zero its velocity."""
+    tid = wp.tid()
+    i = indices[tid]
+    body_q_out[i] = body_q_in[i]
+    body_qd_out[i] = wp.spatial_vector()
+
+
+@wp.kernel
+def follow_targets(
+    indices: wp.array(dtype=wp.int32),  # type: ignore
+    targets: wp.array(dtype=wp.transform),  # type: ignore
+    weight: float,
+    inv_dt: float,
+    set_velocity: int,
+    body_q: wp.array(dtype=wp.transform),  # type: ignore
+    body_qd: wp.array(dtype=wp.spatial_vector),  # type: ignore
+):
+    """Move each indexed body towards its target transform.
+
+    The location keeps `weight` of the offset from the target, as `smooth_lerp`,
+    and the rotation snaps to the target. With `set_velocity` the linear part of
+    the velocity is set to the distance moved over the step, for pushing particles.
+    """
+    tid = wp.tid()
+    i = indices[tid]
+    target = targets[tid]
+    location = wp.transform_get_translation(target)
+    offset = wp.transform_get_translation(body_q[i]) - location
+    body_q[i] = wp.transform(
+        location + offset * weight, wp.transform_get_rotation(target)
+    )
+    if set_velocity != 0:
+        v = offset * ((weight - 1.0) * inv_dt)
+        qd = body_qd[i]
+        body_qd[i] = wp.spatial_vector(v[0], v[1], v[2], qd[3], qd[4], qd[5])
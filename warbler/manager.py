@@ -1,25 +1,77 @@
 from .simulation import SimulatorXPBD, SimulatorBase
+from contextlib import contextmanager
 import bpy
-from bpy.types import Context, Scene
+from bpy.types import Collection, Context, Depsgraph, Object, Scene
 from bpy.app.handlers import persistent
 from . import props
 
+# scene pointer -> (active index, number of items, manager, active item), so that
+# panel redraws can skip resolving the active item through the collection
+_DRAW_CACHE: dict[int, tuple] = {}
+# simulation uuid -> (time_compute, time_sync) and the labels formatted from them,
+# filled by the panel and cleared with the draw cache so removed uuids go too
+_TIMING_LABELS: dict[str, tuple[tuple[float, float], tuple[str, str, str]]] = {}
+
+
+def _clear_draw_caches() -> None:
+    _DRAW_CACHE.clear()
+    _TIMING_LABELS.clear()
+
 
 class SimulationManager:
     def __init__(self):
-        self.simulations: dict[str, SimulatorXPBD] = {}
+        # kept in the same order as `sim_items`, with `_indices` mapping uuid -> index
+        self.simulations: list[SimulatorXPBD] = []
+        self._indices: dict[str, int] = {}
+        self._scene: Scene | None = None
+        self._wb_props: props.WarblerSceneProperties | None = None
+        self._sim_items: bpy.types.bpy_prop_collection_idprop | None = None
+        # nesting depth of `batched_updates()` and whether anything changed inside
+        self._batch_depth: int = 0
+        self._dirty: bool = False
+        # number of items when last reconciled, -1 until reconciled after binding
+        self._reconciled_count: int = -1
+
+    def bind(self, scene: Scene | None = None) -> None:
+        """Cache the RNA lookups for `scene`, defaulting to the context scene."""
+        if scene is None:
+            scene = bpy.context.scene
+        cached = self._scene
+        if cached is not None:
+            # a deleted scene leaves the cached lookups pointing at freed data
+            if not any(s == cached for s in bpy.data.scenes):
+                self.unbind()
+            elif scene == cached:
+                return
+        self._scene = scene
+        self._wb_props = scene.wb  # type: ignore
+        self._sim_items = self._wb_props.sim_list  # type: ignore
+
+    def unbind(self) -> None:
+        """Forget cached RNA lookups, which become invalid after loading or undo."""
+        self._scene = None
+        self._wb_props = None
+        self._sim_items = None
+        self._reconciled_count = -1
+        _clear_draw_caches()
 
     @property
     def scene(self) -> Scene:
-        return bpy.context.scene
+        if self._scene is None:
+            self.bind()
+        return self._scene  # type: ignore
 
     @property
     def wb_props(self) -> props.WarblerSceneProperties:
-        return props.scene_properties(bpy.context)
+        if self._wb_props is None:
+            self.bind()
+        return self._wb_props  # type: ignore
 
     @property
     def sim_items(self) -> bpy.types.bpy_prop_collection_idprop:  ## type: ignore
-        return self.scene.wb.sim_list  # type: ignore
+        if self._sim_items is None:
+            self.bind()
+        return self._sim_items  # type: ignore
 
     @property
     def item_index(self) -> int:
@@ -35,29 +87,111 @@ class SimulationManager:
 
     @property
     def active_simulation(self) -> SimulatorBase:
-        return self.simulations[self.active_item.name]
+        return self.simulations[self._indices[self.active_item.name]]
+
+    def find(self, uuid: str) -> SimulatorXPBD | None:
+        """The simulation for `uuid`, or None when it has no simulation yet."""
+        index = self._indices.get(uuid)
+        return None if index is None else self.simulations[index]
 
     def get(self, value: int) -> SimulatorBase:
         item = self.sim_items[value]
-        return self.simulations[item.name]
+        return self.simulations[self._indices[item.name]]
 
     def add(self, simulation: SimulatorXPBD) -> None:
-        self.simulations[simulation.uuid] = simulation
+        self._indices[simulation.uuid] = len(self.simulations)
+        self.simulations.append(simulation)
         item = self.sim_items.add()
         item.name = simulation.uuid
         simulation._manager = self
+        self._changed()
 
-    def step_simulations(self):
-        for id in list(self.simulations.keys()):
-            if id not in self.sim_items:
-                del self.simulations[id]
+    def reconcile(self) -> None:
+        """Drop simulations whose list item has been removed, keeping list order."""
+        by_uuid = {sim.uuid: sim for sim in self.simulations}
+        sim_items = self.sim_items
+        self.simulations = [
+            sim for item in sim_items if (sim := by_uuid.get(item.name)) is not None
+        ]
+        self._indices = {sim.uuid: i for i, sim in enumerate(self.simulations)}
+        self._reconciled_count = len(sim_items)
 
-        for id, sim in self.simulations.items():
+    def _reconcile_if_stale(self) -> None:
+        # items only change through `add()` and `remove()`, which reconcile, or by
+        # undo and loading, which unbind, so sweep once after those rather than
+        # checking every key per frame. Items loaded without a simulation never
+        # match `simulations`, so compare against the count at the last sweep.
+        if len(self.sim_items) != self._reconciled_count:
+            self.reconcile()
+
+    def step_simulations(self, depsgraph: Depsgraph | None = None):
+        self._reconcile_if_stale()
+        if depsgraph is not None:
+            self.tag_updates(depsgraph)
+
+        for sim in self.simulations:
             if sim.is_active:
                 sim.step()
 
+    def tag_updates(self, depsgraph: Depsgraph) -> None:
+        # simulations whose item is gone after undo or loading have no props left to
+        # look up, so drop them before passing any updates on
+        self._reconcile_if_stale()
+        updated = set()
+        moved = set()
+        collections = set()
+        for update in depsgraph.updates:
+            if isinstance(update.id, Object):
+                name = update.id.original.name_full
+                if update.is_updated_geometry:
+                    updated.add(name)
+                if update.is_updated_transform:
+                    moved.add(name)
+            elif isinstance(update.id, Collection):
+                collections.add(update.id.original.name_full)
+        for sim in self.simulations:
+            if updated:
+                sim.invalidate_geometry(updated)
+            if moved:
+                sim.tag_moved(moved)
+            if collections:
+                sim.invalidate_objects(collections)
+
     def remove(self, index: int) -> None:
         self.sim_items.remove(index)
+        self._changed()
+
+    @contextmanager
+    def batched_updates(self, context: Context | None = None):
+        """Defer reconciling and redrawing after adds and removes until the
+        outermost block exits, so a run of edits costs a single update.
+
+        `simulations` is only brought back in line with `sim_items` on exit, so
+        look simulations up by uuid rather than by index inside the block.
+        """
+        self._batch_depth += 1
+        try:
+            yield self
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0 and self._dirty:
+                self._dirty = False
+                self._flush(context)
+
+    def _changed(self) -> None:
+        if self._batch_depth:
+            self._dirty = True
+        else:
+            self._flush()
+
+    def _flush(self, context: Context | None = None) -> None:
+        self.reconcile()
+        _clear_draw_caches()
+        if context is None or context.screen is None:
+            return
+        for area in context.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
 
 
 def get_manager(context: Context | None) -> SimulationManager:
@@ -65,15 +199,59 @@ def get_manager(context: Context | None) -> SimulationManager:
         context = bpy.context
     if not hasattr(context.scene, "SimulationManager"):
         raise RuntimeError
-    return context.scene.SimulationManager  # type: ignore
+    manager: SimulationManager = context.scene.SimulationManager  # type: ignore
+    manager.bind(context.scene)
+    return manager
+
+
+def get_active_item(
+    context: Context,
+) -> tuple[SimulationManager, props.SimulationListItem]:
+    """The manager and its active item, reused between redraws of the same state."""
+    scene = context.scene
+    sprops: props.WarblerSceneProperties = scene.wb  # type: ignore
+    key = scene.as_pointer()
+    idx = sprops.manager_active_index
+    n = len(sprops.sim_list)
+    cached = _DRAW_CACHE.get(key)
+    if cached is not None and cached[0] == idx and cached[1] == n:
+        return cached[2], cached[3]
+
+    man = get_manager(context)
+    item = man.active_item
+    _DRAW_CACHE[key] = (idx, n, man, item)
+    return man, item
+
+
+def update_simulations(
+    scene: bpy.types.Scene, depsgraph: Depsgraph | None = None
+) -> None:
+    if hasattr(scene, "SimulationManager"):
+        manager: SimulationManager = scene.SimulationManager  # type: ignore
+        manager.bind(scene)
+        manager.step_simulations(depsgraph)
 
 
-def update_simulations(scene: bpy.types.Scene) -> None:
+@persistent
+def _tag_updates(scene: Scene, depsgraph: Depsgraph) -> None:
     if hasattr(scene, "SimulationManager"):
         manager: SimulationManager = scene.SimulationManager  # type: ignore
-        manager.step_simulations()
+        manager.bind(scene)
+        manager.tag_updates(depsgraph)
+
+
+@persistent
+def _step_simulations(scene: Scene, depsgraph: Depsgraph) -> None:
+    update_simulations(scene, depsgraph)
 
 
 @persistent
-def _step_simulations(self, context: bpy.types.Context) -> None:
-    update_simulations(context.scene)
+def _unbind(*args) -> None:
+    if hasattr(bpy.types.Scene, "SimulationManager"):
+        manager: SimulationManager = bpy.types.Scene.SimulationManager  # type: ignore
+        manager.unbind()
+        # simulations outlive the data they cached geometry from
+        for sim in manager.simulations:
+            sim.clear_geometry()
+    # loading and undo change properties without running their update callbacks
+    props.tag_active_changed()
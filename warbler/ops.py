@@ -5,23 +5,23 @@ from .simulation import SimulatorXPBD
 
 
 class ReturnValues:
-    RUNNING_MODAL = {"RUNNING_MODAL"}
-    CANCELLED = {"CANCELLED"}
-    FINISHED = {"FINISHED"}
-    PASS_THROUGH = {"PASS_THROUGH"}
-    INTERFACE = {"INTERFACE"}
+    RUNNING_MODAL = frozenset({"RUNNING_MODAL"})
+    CANCELLED = frozenset({"CANCELLED"})
+    FINISHED = frozenset({"FINISHED"})
+    PASS_THROUGH = frozenset({"PASS_THROUGH"})
+    INTERFACE = frozenset({"INTERFACE"})
 
 
 class ReportValues:
-    DEBUG = {"DEBUG"}
-    INFO = {"INFO"}
-    OPERATOR = {"OPERATOR"}
-    PROPERTY = {"PROPERTY"}
-    WARNING = {"WARNING"}
-    ERROR = {"ERROR"}
-    ERROR_INVALID_INPUT = {"ERROR_INVALID_INPUT"}
-    ERROR_INVALID_CONTEXT = {"ERROR_INVALID_CONTEXT"}
-    ERROR_OUT_OF_MEMORY = {"ERROR_OUT_OF_MEMORY"}
+    DEBUG = frozenset({"DEBUG"})
+    INFO = frozenset({"INFO"})
+    OPERATOR = frozenset({"OPERATOR"})
+    PROPERTY = frozenset({"PROPERTY"})
+    WARNING = frozenset({"WARNING"})
+    ERROR = frozenset({"ERROR"})
+    ERROR_INVALID_INPUT = frozenset({"ERROR_INVALID_INPUT"})
+    ERROR_INVALID_CONTEXT = frozenset({"ERROR_INVALID_CONTEXT"})
+    ERROR_OUT_OF_MEMORY = frozenset({"ERROR_OUT_OF_MEMORY"})
 
 
 class BaseOperator(Operator):
@@ -42,7 +42,8 @@ class WB_OT_AddSimulation(BaseOperator):
 
     def execute(self, context):
         man = self.manager(context)
-        man.add(SimulatorXPBD())
+        with man.batched_updates(context):
+            man.add(SimulatorXPBD())
         return ReturnValues.FINISHED
 
 
@@ -54,7 +55,7 @@ class WB_OT_CompileSimulation(BaseOperator):
     def execute(self, context):
         man = self.manager(context)
         try:
-            man.active_simulation.compile()
+            man.active_simulation.compile(context.evaluated_depsgraph_get())
         except Exception as e:
             self.report(
                 ReportValues.ERROR,
@@ -72,13 +73,9 @@ class WB_OT_RemoveSimulation(BaseOperator):
 
     def execute(self, context: Context):
         man = self.manager(context)
-        item = man.active_item
-        try:
-            del man.simulations[item.name]
-            man.sim_items.remove(man.item_index)
-        except Exception:
-            man.sim_items.remove(man.item_index)
-        man.item_index = max(0, man.item_index - 1)
+        with man.batched_updates(context):
+            man.remove(man.item_index)
+            man.item_index = max(0, man.item_index - 1)
         return ReturnValues.FINISHED
 
 
@@ -1,18 +1,44 @@
 import bpy
 from bpy.types import Panel, UILayout
 
-from .manager import get_manager
+from .manager import _TIMING_LABELS, get_active_item
 from .ops import WB_OT_AddSimulation, WB_OT_CompileSimulation, WB_OT_RemoveSimulation
-from .props import WarblerObjectProperties, WarblerSceneProperties
-
-
-def create_panel(
-    layout: UILayout, idname: str | None = None, default_closed: bool = False
-) -> tuple[UILayout, UILayout]:
-    if idname is None:
-        idname = "NewPanelName"
-    header, panel = layout.panel(idname, default_closed=default_closed)
-    return header, panel
+from .props import (
+    SimulationListItem,
+    WarblerObjectProperties,
+    WarblerSceneProperties,
+)
+
+# SimulationListItem properties drawn as plain rows in each panel section
+SPRING_PROPS = ("spring_ke", "spring_kd", "spring_kf")
+RIGID_BODY_PROPS = (
+    "sim_rigid_collection",
+    "rigid_decay_frames",
+    "substeps",
+    "is_active",
+)
+
+# bound format methods for the timing labels, taking a value in ms
+_TIME_FMT = "Simulation time: {:,.2f} ms".format
+_COMPUTE_FMT = "Compute:  {:,.2f} ms".format
+_SYNC_FMT = "Sync:  {:,.2f} ms".format
+
+
+def timing_labels(item: SimulationListItem) -> tuple[str, str, str]:
+    """Labels for the last step timings, only formatted again when they change."""
+    times = (item.time_compute, item.time_sync)
+    cached = _TIMING_LABELS.get(item.name)
+    if cached is not None and cached[0] == times:
+        return cached[1]
+
+    time_compute, time_sync = times
+    labels = (
+        _TIME_FMT((time_compute + time_sync) * 1e3),
+        _COMPUTE_FMT(time_compute * 1e3),
+        _SYNC_FMT(time_sync * 1e3),
+    )
+    _TIMING_LABELS[item.name] = (times, labels)
+    return labels
 
 
 class WB_UL_RigidBodyCollection(bpy.types.UIList):
@@ -34,6 +60,22 @@ class WB_UL_RigidBodyCollection(bpy.types.UIList):
         row.label(text=item.name)
         row.prop(props, "is_active", text="", icon_only=True, icon="ADD")
 
+    def filter_items(self, context, data, propname):
+        # empty lists leave every row visible in collection order, so without a
+        # name filter there is no need to walk the objects at all
+        if not self.filter_name and not self.use_filter_sort_alpha:
+            return [], []
+
+        objects = getattr(data, propname)
+        helpers = bpy.types.UI_UL_list
+        flags = helpers.filter_items_by_name(
+            self.filter_name, self.bitflag_filter_item, objects, "name"
+        )
+        order = []
+        if self.use_filter_sort_alpha:
+            order = helpers.sort_items_by_name(objects, "name")
+        return flags, order
+
 
 class WB_PT_WarblerPanel(Panel):
     bl_idname = "WB_PT_WarblerPanel"
@@ -44,12 +86,12 @@ class WB_PT_WarblerPanel(Panel):
     def draw(self, context):
         layout: UILayout = self.layout
         assert layout is not None and context is not None
-        man = get_manager(context)
-        sprops: WarblerSceneProperties = context.scene.wb  # type: ignore
+        scene = context.scene
+        sprops: WarblerSceneProperties = scene.wb  # type: ignore
         layout.label(text="Simulation Settings")
         # obj = context.active_object
 
-        layout.prop(context.scene.render, "fps")
+        layout.prop(scene.render, "fps")
 
         layout.separator()
         layout.label(text="Active Object Settings")
@@ -70,13 +112,30 @@ class WB_PT_WarblerPanel(Panel):
         col.operator(WB_OT_AddSimulation.bl_idname, text="", icon="ADD")
         col.operator(WB_OT_RemoveSimulation.bl_idname, text="", icon="REMOVE")
 
-        try:
-            item = man.active_item
-        except IndexError:
-            return
+
+class WB_PT_WarblerSimulation(Panel):
+    bl_idname = "WB_PT_WarblerSimulation"
+    bl_label = "Simulation"
+    bl_space_type = "VIEW_3D"
+    bl_region_type = "UI"
+    bl_parent_id = WB_PT_WarblerPanel.bl_idname
+    bl_options = {"HIDE_HEADER"}  # noqa: RUF012
+
+    @classmethod
+    def poll(cls, context):
+        # skip drawing (and every property lookup below) when no simulation is selected
+        sprops: WarblerSceneProperties = context.scene.wb  # type: ignore
+        return 0 <= sprops.manager_active_index < len(sprops.sim_list)
+
+    def draw(self, context):
+        layout: UILayout = self.layout
+        assert layout is not None and context is not None
+        sprops: WarblerSceneProperties = context.scene.wb  # type: ignore
+        man, item = get_active_item(context)
+        is_compiled = item.is_compiled
 
         col = layout.column()
-        col.enabled = not item.is_compiled
+        col.enabled = not is_compiled
 
         col.template_list(
             "WB_UL_RigidBodyCollection",
@@ -88,45 +147,53 @@ class WB_PT_WarblerPanel(Panel):
             rows=3,
         )
 
-        if item.is_compiled:
-            full_time = item.time_sync + item.time_compute
-            col.label(text=f"Simulation time: {full_time * 1e3:,.2f} ms")
-            col.label(text=f"Compute:  {item.time_compute * 1e3:,.2f} ms")
-            col.label(text=f"Sync:  {item.time_sync * 1e3:,.2f} ms")
+        # the toggle stays editable while compiled, so it sits between the columns
+        layout.prop(item, "record_timings")
+        col = layout.column()
+        col.enabled = not is_compiled
+
+        if is_compiled and item.record_timings:
+            for label in timing_labels(item):
+                col.label(text=label)
 
         col.prop(item, "scale")
 
-        header, panel = create_panel(layout, idname="particles")
+        # collapsed sections return no body, so their contents are never built
+        header, panel = layout.panel("particles", default_closed=False)
         header.label(text="Particles")
         if panel:
             col = panel.column()
             col.prop(item, "particle_source", text="Source")
 
-            header, panel = create_panel(panel, "spring")
-            if header:
-                header.label(text="Springs")
+            header, panel = panel.panel("spring", default_closed=False)
+            header.label(text="Springs")
             if panel:
                 col = panel.column()
-                col.prop(item, "spring_ke")
-                col.prop(item, "spring_kd")
-                col.prop(item, "spring_kf")
+                for name in SPRING_PROPS:
+                    col.prop(item, name)
 
-        header, panel = create_panel(layout, idname="rigid_bodies")
+        header, panel = layout.panel("rigid_bodies", default_closed=False)
         header.label(text="Rigid Bodies")
         if panel:
             col = panel.column()
+            for name in RIGID_BODY_PROPS:
+                col.prop(item, name)
 
-            col.prop(item, "sim_rigid_collection")
-            col.prop(item, "rigid_decay_frames")
-            col.prop(item, "substeps")
-            col.prop(item, "is_active")
+        # the rigid body collection no longer matches the bodies that were built
+        sim = man.find(item.name) if is_compiled else None
+        needs_recompile = sim is not None and sim.needs_recompile
+        if needs_recompile:
+            row = layout.row()
+            row.alert = True
+            row.label(text="Rigid bodies changed, re-compile to sync", icon="ERROR")
 
         row = layout.row()
+        row.alert = needs_recompile
         row.scale_y = 2
         row.operator(
             WB_OT_CompileSimulation.bl_idname,
-            text="Compile" if not item.is_compiled else "Re-Compile",
+            text="Compile" if not is_compiled else "Re-Compile",
         )
 
 
-CLASSES = [WB_PT_WarblerPanel, WB_UL_RigidBodyCollection]
+CLASSES = [WB_PT_WarblerPanel, WB_PT_WarblerSimulation, WB_UL_RigidBodyCollection]
@@ -1,3 +1,5 @@
+import sys
+
 import bpy
 from bpy.props import (
     BoolProperty,
@@ -11,23 +13,46 @@ from bpy.props import (
 )
 from bpy.types import Context, Object, PropertyGroup
 
+DEVICE_ITEMS = (
+    ("cuda", "CUDA", "Compile for the GPU and simulate using CUDA"),
+    ("cpu", "CPI", "Compile for running on the CPU and not using CUDA on the GPU"),
+)
+
+SHAPE_ITEMS = (
+    ("CUBE", "Cube", "Cube shape for the rigid body"),
+    ("SPHERE", "Sphere", "Sphere shape for the rigid body"),
+    ("PLANE", "Plane", "Plane shape for the rigid body"),
+    ("MESH", "Mesh", "Uses the triangular mesh for the object for collisions"),
+    ("CONE", "Cone", "Cone shape for the rigid body"),
+    ("CYLINDER", "Cylinder", "Cylinder shape for the rigid body"),
+    ("CAPSULE", "Capsule", "Capsule shape for the rigid body"),
+)
+
+
+# incremented whenever an object's `is_active` changes, so that simulations only
+# re-partition their rigid bodies into active and manual after an actual edit
+_active_version = 0
+
+
+def tag_active_changed(*args) -> None:
+    global _active_version
+    _active_version += 1
+
+
+def active_version() -> int:
+    return _active_version
+
 
 class SimulationListItem(bpy.types.PropertyGroup):
     name: StringProperty(name="UUID")  # type: ignore
     time_compute: FloatProperty(name="Time", default=0.0)  # type: ignore
     time_sync: FloatProperty(name="Time", default=0.0)  # type: ignore
+    record_timings: BoolProperty(name="Record Timings", default=False)  # type: ignore
     is_active: BoolProperty(name="Active", default=True)  # type: ignore
     is_compiled: BoolProperty(name="Compiled", default=False)  # type: ignore
     substeps: IntProperty(name="Substeps", default=5, min=0, soft_max=100)  # type: ignore
     device: EnumProperty(  # type: ignore
-        items=(
-            ("cuda", "CUDA", "Compile for the GPU and simulate using CUDA"),
-            (
-                "cpu",
-                "CPI",
-                "Compile for running on the CPU and not using CUDA on the GPU",
-            ),
-        ),
+        items=DEVICE_ITEMS,
         default="cuda",
     )
     use_ground_plane: BoolProperty("Ground Plane", default=True)  # type: ignore
@@ -126,19 +151,12 @@ class WarblerObjectProperties(PropertyGroup):
         name="Is Active",
         description="Active ridid body in the simulation, updating it's position based on forces",
         default=False,
+        update=tag_active_changed,
     )
     sim_shape: EnumProperty(  # type: ignore
         name="Shape",
         description="Shape of the rigid body in the simulation",
-        items=[
-            ("CUBE", "Cube", "Cube shape for the rigid body"),
-            ("SPHERE", "Sphere", "Sphere shape for the rigid body"),
-            ("PLANE", "Plane", "Plane shape for the rigid body"),
-            ("MESH", "Mesh", "Uses the triangular mesh for the object for collisions"),
-            ("CONE", "Cone", "Cone shape for the rigid body"),
-            ("CYLINDER", "Cylinder", "Cylinder shape for the rigid body"),
-            ("CAPSULE", "Capsule", "Capsule shape for the rigid body"),
-        ],
+        items=SHAPE_ITEMS,
         default="CUBE",
     )
     rigid_density: FloatProperty(  # type: ignore
@@ -183,6 +201,17 @@ class WarblerObjectProperties(PropertyGroup):
     )
 
 
+# (property name, ShapeConfig keyword) for every `rigid_` property, resolved once
+# here instead of scanning `dir()` for each rigid body. Annotation names are
+# already interned, the stripped keywords are interned so that keyword matching
+# in ShapeConfig takes the identity fast path.
+RIGID_SHAPE_KWARGS = tuple(
+    (name, sys.intern(name.removeprefix("rigid_")))
+    for name in WarblerObjectProperties.__annotations__
+    if name.startswith("rigid_")
+)
+
+
 CLASSES = [
     # have to make sure we register the item -> list -> collection in order
     # otherwise Blender won't know about the others when registering
@@ -4,13 +4,15 @@ import databpy as db
 from . import utils
 from .utils import quat_to_blender
 from bpy.types import Object
-from .props import WarblerObjectProperties
+from .props import RIGID_SHAPE_KWARGS, WarblerObjectProperties
 
 
 class RigidObject(db.BlenderObjectBase):
     def __init__(self, obj: Object):
         super().__init__(obj)
-        self.object.rotation_mode = "QUATERNION"
+        # writing the property tags the object for update even when unchanged
+        if self.object.rotation_mode != "QUATERNION":
+            self.object.rotation_mode = "QUATERNION"
 
     @property
     def props(self) -> WarblerObjectProperties:
@@ -24,12 +26,10 @@ class RigidObject(db.BlenderObjectBase):
         return utils.wp_transform(self.object)
 
     def shape_config(self) -> newton.ModelBuilder.ShapeConfig:
-        prop_names: list[str] = [x for x in dir(self.props) if x.startswith("rigid_")]
-        prop_dict = {
-            name.replace("rigid_", ""): getattr(self.props, name) for name in prop_names
-        }
-
-        return newton.ModelBuilder.ShapeConfig(**prop_dict)
+        props = self.props
+        return newton.ModelBuilder.ShapeConfig(
+            **{key: getattr(props, name) for name, key in RIGID_SHAPE_KWARGS}
+        )
 
     def transform_from_wp(self, transform: wp.transform) -> None:
         self.object.location = transform[0:3]
@@ -1,4 +1,4 @@
-from bpy.types import Object
+from bpy.types import Depsgraph, Object
 from .geometryset import GeometrySet
 import bpy
 import warp as wp
@@ -6,12 +6,16 @@ import newton
 import numpy as np
 import databpy as db
 from .utils import (
-    smooth_lerp,
-    blender_rotation,
+    blender_to_quat_batch,
+    quat_to_blender_batch,
+    settle_frames,
+    smooth_weight,
+    resolve_device,
+    tag_redraw_view3d,
     wp_transform,
 )
-from . import rigid
-from .props import SimulationListItem
+from . import kernels, rigid
+from .props import SimulationListItem, active_version
 from uuid import uuid1
 from typing import TYPE_CHECKING
 from abc import ABC
@@ -21,6 +25,9 @@ import time
 if TYPE_CHECKING:
     from .manager import SimulationManager
 
+# shortest time between writes of the step timings to the panel
+TIMINGS_INTERVAL_NS = 500_000_000
+
 
 class SimulatorBase(ABC):
     @property
@@ -55,7 +62,7 @@ class SimulatorBase(ABC):
 
     @property
     def device(self) -> str:
-        return self.props.device
+        return resolve_device(self.props.device)
 
     @device.setter
     def device(self, value: str) -> None:
@@ -73,11 +80,11 @@ class SimulatorBase(ABC):
         self._uuid: str = str(uuid1())
         self._manager: SimulationManager | None = None
 
-    def _compile(self) -> None:
+    def _compile(self, depsgraph: Depsgraph | None = None) -> None:
         raise NotImplementedError
 
-    def compile(self) -> None:
-        self._compile()
+    def compile(self, depsgraph: Depsgraph | None = None) -> None:
+        self._compile(depsgraph)
         self.props.is_compiled = True
 
 
@@ -106,7 +113,7 @@ class SimulatorXPBD(SimulatorBase):
 
     @property
     def objects(self) -> list[Object]:
-        return [o for o in self.props.sim_rigid_collection.objects]
+        return list(self.props.sim_rigid_collection.objects)
 
     # ============================================================================
     # Initialization
@@ -119,15 +126,36 @@ class SimulatorXPBD(SimulatorBase):
         super().__init__()
         self.clock: int = 0
         self.bob: db.BlenderObject | None = None
-        self.search_radius = 1.0
-
-    def _compile(self) -> None:
+        self._geometry_cache: dict[str, GeometrySet] = {}
+        # timings (ms, to the 0.01 shown in the panel) last written to the props
+        self._shown_times: tuple[float, float] = (-1.0, -1.0)
+        self._timings_written_ns: int = 0
+        self._particle_defaults_block: np.ndarray = np.empty((0, 5), dtype=np.float32)
+        # indices of active and manually-controlled bodies, kept until an object's
+        # `is_active` changes, with the manual indices also kept on the device
+        self._masks_version: int = -1
+        self._objects: tuple[Object, ...] = ()
+        # names of the objects the bodies were built from, in body order, and
+        # whether the collection has since changed so that they no longer line up
+        self._body_names: tuple[str, ...] = ()
+        self.needs_recompile: bool = False
+        self._active_indices: np.ndarray = np.empty(0, dtype=np.int32)
+        self._manual_indices: np.ndarray = np.empty(0, dtype=np.int32)
+        self._manual_indices_wp: wp.array | None = None
+        self._manual_targets: np.ndarray = np.empty((0, 7), dtype=np.float32)
+        # names of the manual objects, and whether any has moved since it was last
+        # followed, with the frames left for the bodies to settle afterwards
+        self._manual_names: frozenset[str] = frozenset()
+        self._kinematics_dirty: bool = True
+        self._settle_frames: int = 0
+
+    def _compile(self, depsgraph: Depsgraph | None = None) -> None:
         if self.props.is_compiled:
             del self.model
-        self.build()
+        self.build(depsgraph)
         self.finalize()
 
-    def build(self):
+    def build(self, depsgraph: Depsgraph | None = None):
         # axis_map = {
         #     (0, 0, 1): newton.Axis.Z,
         #     (0, 1, 0): newton.Axis.Y,
@@ -138,46 +166,158 @@ class SimulatorXPBD(SimulatorBase):
         self.builder = newton.ModelBuilder(up_axis=newton.Axis.Z)
         self.builder.default_particle_radius = 1.0
 
-        self._add_rigid_bodies(self.objects)
+        self._add_rigid_bodies(self.props.sim_rigid_collection.objects)
         if self.props.use_ground_plane:
             self.builder.add_ground_plane()
 
         if self.props.particle_source is not None:
-            geo = GeometrySet(self.props.particle_source)
+            geo = GeometrySet.from_cache(
+                self.props.particle_source, self._geometry_cache, depsgraph
+            )
             self._add_particles(**geo.pointcloud.to_props())
 
+    def invalidate_geometry(self, names: set[str]) -> None:
+        """Drop cached source geometry for objects that have been re-evaluated."""
+        for name in names & self._geometry_cache.keys():
+            del self._geometry_cache[name]
+
+    def clear_geometry(self) -> None:
+        """Drop all cached source geometry, which loading and undo invalidate."""
+        self._geometry_cache.clear()
+
+    def invalidate_objects(self, names: set[str]) -> None:
+        """Resolve the rigid body objects again once their collection has changed."""
+        collection = self.props.sim_rigid_collection
+        if collection is not None and collection.name_full in names:
+            self._masks_version = -1
+
+    def tag_moved(self, names: set[str]) -> None:
+        """Note that some objects have moved, so manual bodies may need to follow."""
+        if not self._kinematics_dirty and not self._manual_names.isdisjoint(names):
+            self._kinematics_dirty = True
+
     def finalize(self):
         self.model: newton.Model = self.builder.finalize(device=self.device)
 
         self.state_0: newton.State = self.model.state()
         self.state_1: newton.State = self.model.state()
+        # every state from the model has the same arrays, so check them only once
+        self._has_body_q: bool = getattr(self.state_0, "body_q", None) is not None
+        self._has_body_qd: bool = getattr(self.state_0, "body_qd", None) is not None
+        # a whole step is captured as a CUDA graph and replayed, which needs the
+        # memory pool so that allocations during capture are allowed
+        device = self.model.device
+        self._use_graph: bool = device.is_cuda and wp.is_mempool_enabled(device)
+        self._graph: wp.Graph | None = None
+        self._graph_dt: float = 0.0
+        self._masks_version = -1
+        self._manual_indices_wp = None
+        self.needs_recompile = False
+        # persistent host copy of `body_q` read back after each step, page-locked
+        # when simulating on a GPU so the copy is a direct DMA transfer, with a
+        # NumPy view of the same memory
+        self._body_q_host_wp: wp.array = wp.empty(
+            self.model.body_count,
+            dtype=wp.transform,
+            device="cpu",
+            pinned=self.model.device.is_cuda,
+        )
+        self._body_q_host: np.ndarray = self._body_q_host_wp.numpy()
+        # persistent host copies of the particle state, written back to Blender, with
+        # NumPy views of the same memory made once rather than on every step
+        self._particle_q_host_wp, self._particle_qd_host_wp = (
+            wp.empty(
+                self.model.particle_count,
+                dtype=wp.vec3,
+                device="cpu",
+                pinned=self.model.device.is_cuda,
+            )
+            for _ in range(2)
+        )
+        self._particle_q_host: np.ndarray = self._particle_q_host_wp.numpy()
+        self._particle_qd_host: np.ndarray = self._particle_qd_host_wp.numpy()
+        # on a GPU the host copies are queued on their own stream after each solve,
+        # with events marking when the rigid bodies and the particles have arrived
+        self._readback_stream: wp.Stream | None = (
+            wp.Stream(self.model.device) if self.model.device.is_cuda else None
+        )
+        self._body_q_event: wp.Event | None = None
+        self._particles_event: wp.Event | None = None
+        # Blender locations and (w, x, y, z) rotations of the rigid body objects
+        self._locations = np.empty((self.model.body_count, 3), dtype=np.float32)
+        self._rotations = np.empty((self.model.body_count, 4), dtype=np.float32)
 
         self.solver = newton.solvers.SolverXPBD(
             model=self.model,
             iterations=self.substeps,
         )
         self.control = self.model.control()
+        # allocated once and refilled by collide() every step
+        self.contacts: newton.Contacts = self.model.contacts()
+        self._warm_up()
         if self.props.is_compiled:
             bpy.data.objects.remove(self.particle_object.object)
         self.create_pointcloud()
 
-    def _add_rigid_bodies(self, objects: list[bpy.types.Object]):
-        """Add Blender objects as rigid bodies to the model."""
-        for obj in objects:
-            rig = rigid.RigidObject(obj)
-            body = self.builder.add_body(mass=1e5, xform=rig.wp_transform())
+    def _warm_up(self) -> None:
+        """Compile every kernel of a step now rather than on the first frame played.
 
-            if obj.wb.sim_shape == "CUBE":  # type: ignore
-                obj.wb.sim_body_index = self.builder.add_shape_box(  # type: ignore
+        One solve runs on a throwaway pair of states so the simulated state is left
+        untouched, and the kernels that only launch with manual bodies are loaded.
+        """
+        state_0, state_1 = self.state_0, self.state_1
+        self.state_0, self.state_1 = self.model.state(), self.model.state()
+        try:
+            self._solve(self.frame_dt)
+            wp.load_module(kernels, device=self.model.device)
+        finally:
+            self.state_0, self.state_1 = state_0, state_1
+
+    def _add_rigid_bodies(self, objects: bpy.types.CollectionObjects):
+        """Add Blender objects as rigid bodies to the model.
+
+        Every object gets a body, even with an unsupported shape, so that body
+        indices keep lining up with the objects in the collection. Transforms and
+        sizes are gathered for all of them at once, as the builder has no bulk API.
+        """
+        # setting the rotation mode converts the rotation, so it is done first
+        rigs = [rigid.RigidObject(obj) for obj in objects]
+        self._body_names = tuple(obj.name_full for obj in objects)
+        n_bodies = len(rigs)
+        locations = np.empty((n_bodies, 3), dtype=np.float32)
+        rotations = np.empty((n_bodies, 4), dtype=np.float32)
+        half_sizes = np.empty((n_bodies, 3), dtype=np.float32)
+        objects.foreach_get("location", locations.ravel())
+        objects.foreach_get("rotation_quaternion", rotations.ravel())
+        objects.foreach_get("dimensions", half_sizes.ravel())
+        half_sizes /= 2.0
+
+        add_body = self.builder.add_body
+        add_shape_box = self.builder.add_shape_box
+        # shapes sit at the origin of their body
+        shape_xform = wp_transform()
+        for rig, location, rotation, (hx, hy, hz) in zip(
+            rigs,
+            locations.tolist(),
+            blender_to_quat_batch(rotations).tolist(),
+            half_sizes.tolist(),
+        ):
+            props = rig.props
+            xform = wp.transform(wp.vec3(*location), wp.quat(*rotation))
+            body = add_body(mass=1e5, xform=xform)
+
+            shape = props.sim_shape
+            if shape == "CUBE":
+                props.sim_body_index = add_shape_box(
                     body=body,
-                    xform=wp_transform(),
-                    hx=obj.dimensions[0] / 2.0,
-                    hy=obj.dimensions[1] / 2.0,
-                    hz=obj.dimensions[2] / 2.0,
+                    xform=shape_xform,
+                    hx=hx,
+                    hy=hy,
+                    hz=hz,
                     cfg=rig.shape_config(),
                 )
             else:
-                print(Warning(f"Unsupported shape {obj.wb.sim_shape}"))  # type: ignore
+                print(Warning(f"Unsupported shape {shape}"))
 
     def _add_particles(
         self,
@@ -186,14 +326,13 @@ class SimulatorXPBD(SimulatorBase):
         mass: np.ndarray | None = None,
         radius: np.ndarray | None = None,
     ) -> None:
-        if velocity is None:
-            velocity = np.zeros(position.shape, dtype=float)
-        if mass is None:
-            mass = np.repeat(1.0, position.shape[0])
-        if radius is None:
-            radius = np.repeat(0.1, position.shape[0])
-
-        self.search_radius = max(radius) * 2
+        # point cloud attributes are already float32, so this only copies other input
+        position = np.asarray(position, dtype=np.float32)
+        if velocity is None or mass is None or radius is None:
+            defaults = self._particle_defaults(position.shape[0])
+            velocity = defaults[0] if velocity is None else velocity
+            mass = defaults[1] if mass is None else mass
+            radius = defaults[2] if radius is None else radius
 
         self.builder.add_particles(
             pos=position,  # type: ignore
@@ -202,6 +341,27 @@ class SimulatorXPBD(SimulatorBase):
             radius=radius,  # type: ignore
         )
 
+    def _particle_defaults(
+        self, n_particles: int
+    ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Default velocity, mass and radius for `n_particles`.
+
+        Views of a block kept across recompiles. The builder keeps row views of
+        these arrays until `finalize()` rather than copying them, so the block is
+        never written in place: it is only filled when first allocated, and a
+        larger count replaces it with a new block.
+        """
+        block = self._particle_defaults_block
+        if len(block) < n_particles:
+            block = self._particle_defaults_block = np.empty(
+                (n_particles, 5), dtype=np.float32
+            )
+            block[:, 0:3] = 0.0
+            block[:, 3] = 1.0
+            block[:, 4] = 0.1
+        block = block[:n_particles]
+        return block[:, 0:3], block[:, 3], block[:, 4]
+
     def _add_springs(self):
         """Add spring constraints between consecutive particles."""
         pass
@@ -215,79 +375,205 @@ class SimulatorXPBD(SimulatorBase):
 
     def _update_blender_from_simulation(self):
         """Copy physics-controlled body transforms from simulation to Blender."""
-        if self.state_0.body_q is None:
+        if not self._has_body_q:
             return
-        rigid_transforms = self.state_0.body_q.numpy()
-        for i, obj in enumerate(self.objects):
-            rig = rigid.RigidObject(obj)
-            if rig.is_active:
-                rig.transform_from_wp(rigid_transforms[i])
-
-    def _update_simulation_from_blender(self):
-        """Copy manually-controlled body transforms from Blender to simulation."""
-        if self.state_0.body_q is None:
+        rigid_transforms = self._wait_body_q()
+        self._update_masks()
+        active = self._active_indices
+        if not len(active) or self.needs_recompile:
             return
 
-        current_sim_transforms = self.state_0.body_q.numpy()
-        body_velocities = None
-        if hasattr(self.state_0, "body_qd") and self.state_0.body_qd is not None:
-            body_velocities = self.state_0.body_qd.numpy()
-
-        new_transforms = []
-        for i, obj in enumerate(self.objects):
-            rig = rigid.RigidObject(obj)
-
-            if not rig.is_active:
-                transform = self._get_manual_body_transform(
-                    obj, current_sim_transforms[i], body_velocities, i
-                )
-            else:
-                transform = wp.transform(
-                    wp.vec3(*current_sim_transforms[i, 0:3]),
-                    wp.quat(*current_sim_transforms[i, 3:7]),
-                )
-
-            new_transforms.append(transform)
+        objects = self._read_blender_transforms()
+        if objects is None:
+            return
 
-        self.state_0.body_q.assign(new_transforms)
-        if body_velocities is not None:
-            self.state_0.body_qd.assign(body_velocities)
+        locations = self._locations
+        rotations = self._rotations
+        if len(active) == len(locations):
+            # every body is active, so whole columns are copied without gathering
+            locations[:] = rigid_transforms[:, 0:3]
+            quat_to_blender_batch(rigid_transforms[:, 3:7], out=rotations)
+        else:
+            locations[active] = rigid_transforms[active, 0:3]
+            rotations[active] = quat_to_blender_batch(rigid_transforms[active, 3:7])
+        objects.foreach_set("location", locations.ravel())
+        objects.foreach_set("rotation_quaternion", rotations.ravel())
+
+        # bulk writes skip the per-object update, so tag the moved objects, taken
+        # from the frozen tuple rather than indexing the collection through RNA
+        frozen = self._objects
+        for i in active.tolist():
+            frozen[i].update_tag(refresh={"OBJECT"})
 
-    def _get_manual_body_transform(
-        self,
-        obj: bpy.types.Object,
-        current_sim_transform: np.ndarray,
-        body_velocities: np.ndarray | None,
-        body_index: int,
-    ) -> wp.transform:
-        """Calculate transform for manually-controlled body with smoothing.
+    def _update_simulation_from_blender(self):
+        """Copy manually-controlled body transforms from Blender to simulation.
 
         Manually-controlled bodies follow Blender positions but are smoothed
         to avoid jarring movements. Their velocity is calculated to push particles
         but then zeroed to prevent self-movement.
         """
-        rot = blender_rotation(obj.rotation_quaternion)
-        loc = np.array(obj.location)
-
-        # Apply smoothing (except first frame)
-        if self.clock != 0:
-            loc = smooth_lerp(
-                current_sim_transform[0:3],
-                loc,
-                self.props.rigid_decay_frames,
-            )
+        if not self._has_body_q:
+            return
+
+        self._update_masks()
+        indices = self._manual_indices
+        if not len(indices) or self.needs_recompile:
+            return
+
+        # with no new input the bodies keep easing towards their targets for a
+        # few frames, after which they are held in place by the solve itself
+        # the frame rate is read once and shared by the smoothing and the velocity
+        render = self.scene.render
+        fps = render.fps
+        weight = smooth_weight(self.props.rigid_decay_frames, 1 / fps / render.fps_base)
+        if self._kinematics_dirty or self.clock == 0:
+            self._kinematics_dirty = False
+            self._settle_frames = settle_frames(weight)
+        elif self._settle_frames > 0:
+            self._settle_frames -= 1
+        else:
+            return
 
-            # Calculate velocity for particle interaction
-            if body_velocities is not None:
-                velocity = (loc - current_sim_transform[0:3]) / self.frame_dt
-                body_velocities[body_index, 0:3] = velocity
+        if self._read_blender_transforms() is None:
+            return
+        # the targets are the only upload, the smoothing against the current
+        # `body_q` and the velocity both run on the device
+        targets = self._manual_targets
+        locations, rotations = self._locations, self._rotations
+        if len(indices) != len(locations):
+            locations, rotations = locations[indices], rotations[indices]
+        targets[:, 0:3] = locations
+        blender_to_quat_batch(rotations, out=targets[:, 3:7])
+        device = self.model.device
+        # asynchronous on a GPU, the staging buffer is next written after the end
+        # of step readback, which waits for everything queued on the compute stream
+        wp.copy(self._manual_targets_wp, self._manual_targets_host_wp)
+
+        # Apply smoothing and velocity for particle interaction (except first frame)
+        smooth = self.clock != 0
+        wp.launch(
+            kernels.follow_targets,
+            dim=len(indices),
+            inputs=[
+                self._manual_indices_wp,
+                self._manual_targets_wp,
+                weight if smooth else 0.0,
+                float(fps),
+                int(smooth and self._has_body_qd),
+            ],
+            outputs=[self.state_0.body_q, self.state_0.body_qd],
+            device=device,
+        )
 
-        return wp.transform(wp.vec3(*loc), wp.quat(*rot))
+    def _read_blender_transforms(self) -> bpy.types.CollectionObjects | None:
+        """Fill the location and rotation buffers from the rigid body collection.
+
+        Bodies were added in collection order, so rows line up with its objects.
+        Returns those objects, or None once the collection no longer matches the
+        compiled bodies, which needs a re-compile.
+        """
+        objects = self.props.sim_rigid_collection.objects
+        if len(objects) != len(self._locations):
+            return None
+        objects.foreach_get("location", self._locations.ravel())
+        objects.foreach_get("rotation_quaternion", self._rotations.ravel())
+        return objects
+
+    def _update_masks(self) -> None:
+        """Partition the bodies into active and manual, only after `is_active` edits.
+
+        The rigid body objects are frozen alongside, and so are also resolved again
+        after loading and undo, which invalidate the previous references, and once
+        the depsgraph reports a change to the rigid body collection. Objects added,
+        removed or reordered since compiling leave the masks as they were and set
+        `needs_recompile` instead.
+        """
+        version = active_version()
+        if version == self._masks_version:
+            return
+        self._masks_version = version
+
+        objects = tuple(self.objects)
+        # the bodies keep the objects they were built from, so after the collection
+        # changes the previous masks are kept until the simulation is recompiled
+        stale = tuple(obj.name_full for obj in objects) != self._body_names
+        if stale != self.needs_recompile:
+            # shown in the panel, which would otherwise wait for the next redraw
+            self.needs_recompile = stale
+            tag_redraw_view3d()
+        if stale:
+            return
+        self._kinematics_dirty = True
+
+        self._objects = objects
+        active = np.array([obj.wb.is_active for obj in objects], dtype=bool)  # type: ignore
+        self._active_indices = np.flatnonzero(active).astype(np.int32)
+        manual = np.flatnonzero(~active).astype(np.int32)
+        self._manual_names = frozenset(objects[i].name_full for i in manual.tolist())
+        # the device copy is only needed again when the manual set itself changes
+        if self._manual_indices_wp is not None and np.array_equal(
+            manual, self._manual_indices
+        ):
+            return
+        device = self.model.device
+        self._manual_indices = manual
+        self._manual_indices_wp = wp.array(manual, dtype=wp.int32, device=device)
+        # target transforms of the manual bodies, staged in page-locked memory on
+        # a GPU, with a NumPy view of the same memory
+        self._manual_targets_host_wp = wp.empty(
+            len(manual), dtype=wp.transform, device="cpu", pinned=device.is_cuda
+        )
+        self._manual_targets = self._manual_targets_host_wp.numpy()
+        self._manual_targets_wp = wp.empty(
+            len(manual), dtype=wp.transform, device=device
+        )
+        # a captured step still launches over the previous indices array
+        self._graph = None
 
     # ============================================================================
     # State Accessors
     # ============================================================================
 
+    # These copy from the simulation device, waiting on any queued work first,
+    # so fetch them once per step and pass the arrays on rather than re-reading.
+
+    def _queue_readback(self) -> None:
+        """Queue copies of the solved state into the persistent host buffers.
+
+        On a GPU they run on the readback stream once the solve has finished, so
+        the rigid bodies can be written to Blender while the particle copy is
+        still in flight. On the CPU the copies complete straight away.
+        """
+        stream = self._readback_stream
+        if stream is not None:
+            stream.wait_stream(wp.get_stream(self.model.device))
+        # only the active bodies are written back to Blender, the manual ones
+        # follow their objects and are never read on the host
+        if self._has_body_q and len(self._active_indices):
+            wp.copy(self._body_q_host_wp, self.state_0.body_q, stream=stream)
+            if stream is not None:
+                self._body_q_event = stream.record_event()
+        wp.copy(self._particle_q_host_wp, self.state_0.particle_q, stream=stream)
+        wp.copy(self._particle_qd_host_wp, self.state_0.particle_qd, stream=stream)
+        if stream is not None:
+            self._particles_event = stream.record_event()
+
+    def _wait_body_q(self) -> np.ndarray:
+        """Wait for the queued `body_q` readback and return the host view."""
+        if self._body_q_event is not None:
+            wp.synchronize_event(self._body_q_event)
+            self._body_q_event = None
+        return self._body_q_host
+
+    def _wait_particles(self) -> tuple[np.ndarray, np.ndarray]:
+        """Wait for the queued particle readback, returning views of the host
+        buffers that are overwritten by the next step.
+        """
+        if self._particles_event is not None:
+            wp.synchronize_event(self._particles_event)
+            self._particles_event = None
+        return self._particle_q_host, self._particle_qd_host
+
     @property
     def particle_positions(self) -> np.ndarray:
         """Get current particle positions from simulation state."""
@@ -298,6 +584,20 @@ class SimulatorXPBD(SimulatorBase):
         """Get current particle velocities from simulation state."""
         return self.state_0.particle_qd.numpy()  # type: ignore
 
+    @property
+    def particle_positions_device(self) -> wp.array:
+        """Current particle positions, left on the simulation device.
+
+        Warp arrays expose `__cuda_array_interface__` and DLPack, so consumers
+        that accept device memory can use these without any copy to the host.
+        """
+        return self.state_0.particle_q
+
+    @property
+    def particle_velocities_device(self) -> wp.array:
+        """Current particle velocities, left on the simulation device."""
+        return self.state_0.particle_qd
+
     # ============================================================================
     # Physics Simulation (State → Solver → Updated State)
     # ============================================================================
@@ -306,51 +606,54 @@ class SimulatorXPBD(SimulatorBase):
         """Execute one physics timestep following Newton's pattern:
         State → Solver → Updated State
         """
+        dt = self.frame_dt
+        if not self._use_graph:
+            self._solve(dt)
+            # Swap double-buffered states
+            self.state_0, self.state_1 = self.state_1, self.state_0
+            return
+
+        # the graph replays with the arrays and time step it was captured with, so
+        # it copies the result back into `state_0` instead of swapping the states
+        if self._graph is None or dt != self._graph_dt:
+            with wp.ScopedCapture(device=self.model.device) as capture:
+                self._solve(dt)
+                self.state_0.assign(self.state_1)
+            self._graph = capture.graph
+            self._graph_dt = dt
+        wp.capture_launch(self._graph)
+
+    def _solve(self, dt: float) -> None:
+        """Advance `state_0` into `state_1` by `dt`, launching only device work."""
         # Prepare state for simulation
+        # SolverXPBD rebuilds `model.particle_grid` from the largest particle radius
+        # at the start of each step, so it is not built here as well
         self.state_0.clear_forces()
-        self.model.particle_grid.build(self.state_0.particle_q, self.search_radius)
-        # Store manual body transforms before solving
-        # manual_body_transforms = self._get_manual_body_transforms()
 
         # Run solver (State → Solver → Updated State)
-        contacts = self.model.collide(self.state_0)
-        self.solver.step(
-            self.state_0, self.state_1, self.control, contacts, self.frame_dt
-        )
+        self.model.collide(self.state_0, self.contacts)
+        self.solver.step(self.state_0, self.state_1, self.control, self.contacts, dt)
 
         # Restore manual bodies (kinematic constraint)
-        # self._restore_manual_body_transforms(manual_body_transforms)
-
-        # Swap double-buffered states
-        self.state_0, self.state_1 = self.state_1, self.state_0
-
-    # def _get_manual_body_transforms(self) -> dict[int, np.ndarray]:
-    #     """Get transforms of manually-controlled bodies before physics solve."""
-    #     manual_transforms = {}
-    #     if self.state_0.body_q is not None:
-    #         current_transforms = self.state_0.body_q.numpy()
-    #         for i, obj in enumerate(self.objects):
-    #             if not obj.wb.is_active:
-    #                 manual_transforms[i] = current_transforms[i].copy()
-    #     return manual_transforms
-
-    # def _restore_manual_body_transforms(self, manual_transforms: dict[int, np.ndarray]):
-    #     """Restore manually-controlled bodies to fixed positions (kinematic behavior)."""
-    #     if not manual_transforms or self.state_1.body_q is None:
-    #         return
-
-    #     # Restore positions
-    #     solved_transforms = self.state_1.body_q.numpy()
-    #     for i, transform in manual_transforms.items():
-    #         solved_transforms[i] = transform
-    #     self.state_1.body_q.assign(solved_transforms)
-
-    #     # Zero velocities to prevent movement
-    #     if hasattr(self.state_1, "body_qd") and self.state_1.body_qd is not None:
-    #         body_velocities = self.state_1.body_qd.numpy()
-    #         for i in manual_transforms.keys():
-    #             body_velocities[i] = 0.0
-    #         self.state_1.body_qd.assign(body_velocities)
+        self._restore_manual_bodies()
+
+    def _restore_manual_bodies(self) -> None:
+        """Hold manually-controlled bodies at their pre-solve transforms with zero
+        velocity, scattering on the device rather than round-tripping through NumPy.
+        """
+        indices = self._manual_indices_wp
+        if indices is None or indices.shape[0] == 0 or not self._has_body_qd:
+            return
+        # indices are sorted, so the last one bounds them all
+        if self._manual_indices[-1] >= self.model.body_count:
+            return
+        wp.launch(
+            kernels.restore_bodies,
+            dim=indices.shape[0],
+            inputs=[indices, self.state_0.body_q],
+            outputs=[self.state_1.body_q, self.state_1.body_qd],
+            device=self.model.device,
+        )
 
     # ============================================================================
     # Visualization
@@ -360,20 +663,48 @@ class SimulatorXPBD(SimulatorBase):
         """Create or update Blender mesh for particle visualization."""
         name = "ParticleObject"
 
+        # staged through the same page-locked buffers as the per-step readback
+        self._queue_readback()
+        positions, velocities = self._wait_particles()
         self.particle_object = db.BlenderObject.from_pointcloud(
-            self.particle_positions,
+            positions,
             name=name,
         )
 
-        self.particle_object.store_named_attribute(
-            np.array(self.builder.particle_radius),
-            "radius",
-        )
+        # every attribute is laid out up front, so later steps only write values
+        attributes = self.particle_object.object.data.attributes  # type: ignore
+        # the finalized model holds the radii as one float32 array, which is a single
+        # copy rather than converting the builder's list of Python floats
+        radii = self.model.particle_radius.numpy()  # type: ignore
+        for name, atype, values in (
+            ("velocity", db.AttributeTypes.FLOAT_VECTOR.value, velocities),
+            ("radius", db.AttributeTypes.FLOAT.value, radii),
+        ):
+            attribute = attributes.get(name)
+            if attribute is None:
+                attribute = attributes.new(name, atype.type_name, "POINT")
+            attribute.data.foreach_set(atype.value_name, values.reshape(-1))
+
+    def _update_particle_visualization(
+        self, positions: np.ndarray, velocities: np.ndarray
+    ) -> None:
+        """Update particle mesh with current simulation state.
 
-    def _update_particle_visualization(self):
-        """Update particle mesh with current simulation state."""
-        self.particle_object.position = self.particle_positions
-        self.particle_object.store_named_attribute(self.velocity, "velocity")
+        Both arrays are written straight into the point cloud attributes with a
+        single `foreach_set` each, with the point count fixed since compiling.
+        """
+        pointcloud: bpy.types.PointCloud = self.particle_object.object.data  # type: ignore
+        attributes = pointcloud.attributes
+        vector = db.AttributeTypes.FLOAT_VECTOR.value
+
+        attributes["position"].data.foreach_set(  # type: ignore
+            vector.value_name, positions.reshape(-1)
+        )
+        velocity = attributes.get("velocity")
+        if velocity is None:
+            velocity = attributes.new("velocity", vector.type_name, "POINT")
+        velocity.data.foreach_set(vector.value_name, velocities.reshape(-1))  # type: ignore
+        pointcloud.update_tag()
 
     # ============================================================================
     # Main Simulation Loop
@@ -387,11 +718,38 @@ class SimulatorXPBD(SimulatorBase):
         Flow: Blender → Simulation → Solve → Blender
         """
         self._update_simulation_from_blender()
-        start_simulate = time.time()
-        self.simulate()
-        self.props.time_compute = time.time() - start_simulate
-        start_sync = time.time()
-        self._update_blender_from_simulation()
-        self._update_particle_visualization()
-        self.props.time_sync = time.time() - start_sync
+        if self.props.record_timings:
+            start_simulate = time.perf_counter_ns()
+            self.simulate()
+            start_sync = time.perf_counter_ns()
+            self._sync_to_blender()
+            self._write_timings(start_simulate, start_sync, time.perf_counter_ns())
+        else:
+            self.simulate()
+            self._sync_to_blender()
         self.clock += 1
+
+    def _sync_to_blender(self) -> None:
+        """Read the solved state back and write it to the Blender objects."""
+        self._queue_readback()
+        self._update_blender_from_simulation()
+        self._update_particle_visualization(*self._wait_particles())
+
+    def _write_timings(self, start_simulate: int, start_sync: int, end: int) -> None:
+        """Store step timings, skipping writes that would not change the panel.
+
+        Every property write notifies the UI and redraws the sidebar, so values
+        are written at most every `TIMINGS_INTERVAL_NS`, and only once they differ
+        at the precision that is displayed.
+        """
+        if end - self._timings_written_ns < TIMINGS_INTERVAL_NS:
+            return
+        time_compute = (start_sync - start_simulate) * 1e-9
+        time_sync = (end - start_sync) * 1e-9
+        shown = (round(time_compute * 1e3, 2), round(time_sync * 1e3, 2))
+        if shown == self._shown_times:
+            return
+        self._timings_written_ns = end
+        self._shown_times = shown
+        self.props.time_compute = time_compute
+        self.props.time_sync = time_sync
@@ -1,13 +1,61 @@
+import math
+import sys
 import numpy as np
 import bpy
 from mathutils import Quaternion
 import warp as wp
 
 
+def resolve_device(device: str) -> str:
+    """Fall back to the CPU when a CUDA device is requested but none is available."""
+    if device.startswith("cuda") and not wp.is_cuda_available():
+        return "cpu"
+    return device
+
+
+def tag_redraw_view3d() -> None:
+    """Redraw every 3D viewport, sidebar included, in all open windows."""
+    window_manager = bpy.context.window_manager
+    if window_manager is None:
+        return
+    for window in window_manager.windows:
+        for area in window.screen.areas:
+            if area.type == "VIEW_3D":
+                area.tag_redraw()
+
+
 def quat_to_blender(quat: np.ndarray) -> list[float]:
     return [quat[3], quat[0], quat[1], quat[2]]
 
 
+def quat_to_blender_batch(
+    quat: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Reorder an (N, 4) array of (x, y, z, w) quaternions to Blender's (w, x, y, z).
+
+    Columns are copied across directly, into `out` when given rather than a new array.
+    """
+    if out is None:
+        out = np.empty_like(quat)
+    out[:, 0] = quat[:, 3]
+    out[:, 1:4] = quat[:, 0:3]
+    return out
+
+
+def blender_to_quat_batch(
+    quat: np.ndarray, out: np.ndarray | None = None
+) -> np.ndarray:
+    """Reorder an (N, 4) array of Blender (w, x, y, z) quaternions to (x, y, z, w).
+
+    Columns are copied across directly, into `out` when given rather than a new array.
+    """
+    if out is None:
+        out = np.empty_like(quat)
+    out[:, 0:3] = quat[:, 1:4]
+    out[:, 3] = quat[:, 0]
+    return out
+
+
 def blender_rotation(quat: Quaternion) -> np.ndarray:
     return np.array([getattr(quat, j) for j in "xyzw"])
 
@@ -30,9 +78,31 @@ def decay_lerp(a, b, decay: int, dt: float) -> np.ndarray:
     return b + (a - b) * np.exp(-decay * dt)
 
 
+def smooth_weight(decay: int = 5, dt: float | None = None) -> float:
+    """Fraction of the remaining distance kept by `smooth_lerp` over one frame.
+
+    Pass `dt` when it is already known to skip reading the frame rate again.
+    """
+    if dt is None:
+        dt = delta_t()
+    return 1.0 - math.exp(-decay * dt)
+
+
+def settle_frames(weight: float, tolerance: float = 1e-4) -> int:
+    """Frames for repeated smoothing with `weight` to close all but `tolerance`
+    of the distance to a fixed target.
+    """
+    if weight <= 0.0:
+        return 0
+    if weight >= 1.0:
+        return sys.maxsize
+    return math.ceil(math.log(tolerance) / math.log(weight))
+
+
 def smooth_lerp(a, b, decay: int = 5) -> np.ndarray:
-    return b + (a - b) * (1 - np.exp(-decay * delta_t()))
+    return b + (a - b) * smooth_weight(decay)
 
 
 def delta_t():
-    return 1 / bpy.context.scene.render.fps / bpy.context.scene.render.fps_base
+    render = bpy.context.scene.render
+    return 1 / render.fps / render.fps_base